@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import sys
 import os
 from dataclasses import dataclass
@@ -14,11 +15,6 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.append(str(SRC))
 
-# --- yfinance Initialization ---
-from deriv_dash.utils import yf_patch  # noqa: F401
-import yfinance as yf
-# -------------------------------
-
 import pandas as pd
 import streamlit as st
 
@@ -31,20 +27,57 @@ from deriv_dash.viz import make_price_chart  # noqa: E402
 
 DEFAULT_TICKERS = ["AAPL", "MSFT", "SPY"]
 
+# Sorted once at import; reruns only need to sort the user's few additions
+_UNIVERSE_SORTED = sorted(set(TICKER_UNIVERSE))
+_UNIVERSE_SET = frozenset(_UNIVERSE_SORTED)
+
 
 @dataclass
 class UiInputs:
-    tickers: list[str]
+    tickers: tuple[str, ...]
     start_date: date
     end_date: date
     config: DashboardState
 
 
-def parse_tickers(raw: str) -> list[str]:
-    parts = [part.strip().upper() for raw_part in raw.replace(";", ",").split(",")]
-    tickers = [part for part in parts if part]
-    deduped = list(dict.fromkeys(tickers))
-    return deduped
+def parse_tickers(raw: str) -> tuple[str, ...]:
+    stripped = (part.strip() for part in raw.replace(";", ",").split(","))
+    return tuple(dict.fromkeys(part.upper() for part in stripped if part))
+
+
+def _frame_fingerprint(df: pd.DataFrame) -> tuple:
+    """Cheap cache key for a prices frame — avoids hashing every cell."""
+    if df.empty:
+        return (df.shape, tuple(df.columns))
+    # Hash the first and last rows so frames with identical shape and span
+    # but different values (close vs adj_close, raw vs normalized) don't
+    # collide — full-frame hashing is what this fingerprint exists to avoid
+    edges = pd.util.hash_pandas_object(df.iloc[[0, -1]]).to_numpy().tobytes()
+    if "date" in df.columns:
+        return (df.shape, tuple(df["ticker"].unique()), df["date"].iloc[0], df["date"].iloc[-1], edges)
+    return (df.shape, tuple(df.columns), df.index[0], df.index[-1], edges)
+
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _frame_fingerprint})
+def _cached_price_matrix(prices_long: pd.DataFrame, field: PriceField) -> pd.DataFrame:
+    return get_price_matrix(prices_long, field)
+
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _frame_fingerprint})
+def _cached_normalized_matrix(prices_matrix: pd.DataFrame) -> pd.DataFrame:
+    return get_normalized_matrix(prices_matrix)
+
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _frame_fingerprint})
+def _to_csv_bytes(df: pd.DataFrame, index: bool = False) -> bytes:
+    """Format a frame as CSV once per input instead of on every rerun."""
+    return df.to_csv(index=index).encode()
+
+
+@functools.lru_cache(maxsize=1)
+def _provider() -> YFinancePricesProvider:
+    """Share one provider (and its HTTP session) across cache misses."""
+    return YFinancePricesProvider()
 
 
 @st.cache_data(show_spinner=False)
@@ -59,8 +92,7 @@ def load_prices_cached(
         auto_adjust=auto_adjust,
         include_extended=include_extended
     )
-    provider = YFinancePricesProvider()
-    return get_prices(provider, query)
+    return get_prices(_provider(), query)
 
 
 def render_sidebar() -> UiInputs:
@@ -80,7 +112,8 @@ def render_sidebar() -> UiInputs:
 
         # Use multiselect with current selections preserved in options
         # We use a key for stable state management to prevent disappearing tickers
-        options = sorted(list(set(TICKER_UNIVERSE + st.session_state.selected_tickers)))
+        extras = sorted({t for t in st.session_state.selected_tickers if t not in _UNIVERSE_SET})
+        options = _UNIVERSE_SORTED + extras
         st.multiselect(
             "Analysis Tickers",
             options=options,
@@ -118,7 +151,7 @@ def render_sidebar() -> UiInputs:
         show_table = st.checkbox("Show summary table", value=True)
         include_extended = st.checkbox("Show Extended Hours", value=False, help="Include pre-market and after-hours data")
 
-    all_tickers = st.session_state.selected_tickers
+    all_tickers = tuple(st.session_state.selected_tickers)
     config = DashboardState(
         price_field=price_field_value, 
         normalize=normalize, 
@@ -174,7 +207,7 @@ def main() -> None:
 
         with st.spinner(f"Fetching prices ({interval} interval)..."):
             prices_long = load_prices_cached(
-                tuple(inputs.tickers),
+                inputs.tickers,
                 inputs.start_date,
                 inputs.end_date,
                 interval,
@@ -189,11 +222,15 @@ def main() -> None:
         st.error("No data returned for the selected inputs.")
         return
 
-    requested = set(inputs.tickers)
-    available = set(prices_long["ticker"].unique())
-    missing = requested - available
+    ticker_col = prices_long["ticker"]
+    if isinstance(ticker_col.dtype, pd.CategoricalDtype):
+        available = set(ticker_col.cat.categories)
+    else:
+        available = set(ticker_col.unique())
+    missing = [t for t in inputs.tickers if t not in available]
     if missing:
-        st.warning(f"No data returned for: {', '.join(sorted(missing))}")
+        listed = missing[0] if len(missing) == 1 else ", ".join(sorted(missing))
+        st.warning(f"No data returned for: {listed}")
 
     # --- Persistent Chart & Timeframe Tools ---
     st.divider()
@@ -208,9 +245,9 @@ def main() -> None:
     tf_row[4].button("MAX", on_click=set_timeframe, kwargs={"max_period": True}, use_container_width=True)
 
     # Main Chart
-    price_matrix = get_price_matrix(prices_long, inputs.config.price_field)
+    price_matrix = _cached_price_matrix(prices_long, inputs.config.price_field)
     if inputs.config.normalize:
-        price_matrix = get_normalized_matrix(price_matrix)
+        price_matrix = _cached_normalized_matrix(price_matrix)
 
     title = f"{inputs.config.price_field.replace('_', ' ').title()} prices"
     if interval != "1d":
@@ -279,7 +316,7 @@ def main() -> None:
         with c1:
             st.download_button(
                 "Download canonical (long) CSV",
-                data=prices_long.to_csv(index=False),
+                data=_to_csv_bytes(prices_long),
                 file_name=f"prices_long_{date.today()}.csv",
                 mime="text/csv",
                 width="stretch"
@@ -288,7 +325,7 @@ def main() -> None:
             if not price_matrix.empty:
                 st.download_button(
                     "Download matrix CSV",
-                    data=price_matrix.to_csv(),
+                    data=_to_csv_bytes(price_matrix, index=True),
                     file_name=f"prices_matrix_{date.today()}.csv",
                     mime="text/csv",
                     width="stretch"
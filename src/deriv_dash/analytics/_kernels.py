@@ -0,0 +1,72 @@
+"""Numeric kernels for hot analytics paths.
+
+Numba is an optional dependency: when it is available the kernels are
+JIT-compiled and parallelized across columns, otherwise plain NumPy
+implementations with identical signatures are used.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+if HAVE_NUMBA:
+
+    @njit(parallel=True, cache=True)
+    def normalize_to_100(arr: np.ndarray) -> np.ndarray:
+        """Rebase each column to 100 at its first non-NaN value."""
+        out = np.empty_like(arr)
+        for j in prange(arr.shape[1]):
+            first = np.nan
+            for i in range(arr.shape[0]):
+                if not np.isnan(arr[i, j]):
+                    first = arr[i, j]
+                    break
+            if first != first or first == 0.0:
+                # No usable base: leave the column as-is
+                for i in range(arr.shape[0]):
+                    out[i, j] = arr[i, j]
+            else:
+                scale = 100.0 / first
+                for i in range(arr.shape[0]):
+                    out[i, j] = arr[i, j] * scale
+        return out
+
+    # No fastmath: its nnan/ninf assumptions are unsafe for the NaN-padded
+    # matrices this runs on; the win here is prange plus vectorization
+    @njit(parallel=True, cache=True)
+    def pct_change_2d(arr: np.ndarray) -> np.ndarray:
+        """Row-over-row percentage change, dropping the first row."""
+        n, m = arr.shape
+        out = np.empty((n - 1, m), arr.dtype)
+        for j in prange(m):
+            for i in range(1, n):
+                out[i - 1, j] = arr[i, j] / arr[i - 1, j] - 1.0
+        return out
+
+else:
+
+    def normalize_to_100(arr: np.ndarray) -> np.ndarray:
+        """Rebase each column to 100 at its first non-NaN value."""
+        if arr.size == 0:
+            return arr.copy()
+        # argmax on the validity mask finds each column's first non-NaN row
+        first_rows = np.argmax(~np.isnan(arr), axis=0)
+        base = arr[first_rows, np.arange(arr.shape[1])]
+        # Columns with no usable base (all-NaN or zero) pass through unscaled
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scale = np.where((base == base) & (base != 0.0), 100.0 / base, 1.0)
+        return arr * scale
+
+    def pct_change_2d(arr: np.ndarray) -> np.ndarray:
+        """Row-over-row percentage change, dropping the first row."""
+        # Zero or NaN prices yield inf/NaN silently, as pct_change did
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return arr[1:] / arr[:-1] - 1.0
@@ -2,19 +2,34 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
+from ._kernels import pct_change_2d
+
 
 def compute_daily_returns(prices: pd.DataFrame) -> pd.DataFrame:
     """Calculate daily percentage change."""
-    if prices.empty:
-        return prices.copy()
-    return prices.pct_change().dropna(how="all")
+    if len(prices) < 2:
+        return prices.iloc[0:0].copy()
+    values = prices.to_numpy()
+    if values.dtype not in (np.float32, np.float64):
+        values = values.astype(np.float64)
+    ratios = pct_change_2d(np.ascontiguousarray(values))
+    return pd.DataFrame(ratios, index=prices.index[1:], columns=prices.columns)
 
 
 def compute_cumulative_returns(daily_returns: pd.DataFrame) -> pd.DataFrame:
     """Convert daily returns to cumulative return curves."""
     if daily_returns.empty:
         return daily_returns.copy()
-    return (1 + daily_returns).cumprod() - 1
-
+    values = daily_returns.to_numpy()
+    if values.dtype not in (np.float32, np.float64):
+        values = values.astype(np.float64)
+    # Match pandas cumprod's skipna: a leading NaN (ticker history starting
+    # inside the window) must not wipe out the rest of the column
+    nan_mask = np.isnan(values)
+    growth = np.where(nan_mask, 1.0, 1.0 + values)
+    cumulative = np.cumprod(growth, axis=0) - 1.0
+    cumulative[nan_mask] = np.nan
+    return pd.DataFrame(cumulative, index=daily_returns.index, columns=daily_returns.columns)
@@ -15,23 +15,18 @@ def build_summary(prices_long: pd.DataFrame, field: str) -> pd.DataFrame:
     if subset.empty:
         return pd.DataFrame(columns=["ticker", "last_price", "total_return_pct", "start_date", "end_date"])
 
-    ordered = subset.sort_values(["ticker", "date"])
-    grouped = ordered.groupby("ticker", sort=True)
-
-    first = grouped.first()
-    last = grouped.last()
-
-    summary = pd.DataFrame(
-        {
-            "ticker": last.index,
-            "start_date": first["date"].values,
-            "end_date": last["date"].values,
-            "start_price": first[value_col].values,
-            "last_price": last[value_col].values,
-        }
+    # Sort by date once (stable, so per-ticker order is preserved) and pull
+    # first/last rows in a single groupby pass instead of two.
+    ordered = subset.sort_values("date", kind="mergesort")
+    summary = ordered.groupby("ticker", sort=True, observed=True).agg(
+        start_price=(value_col, "first"),
+        last_price=(value_col, "last"),
+        start_date=("date", "first"),
+        end_date=("date", "last"),
     )
 
     summary["total_return_pct"] = (summary["last_price"] / summary["start_price"] - 1) * 100
+    summary = summary.reset_index()
 
     return summary[["ticker", "last_price", "total_return_pct", "start_date", "end_date"]]
 
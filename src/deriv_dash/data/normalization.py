@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Iterable
 from typing import Any
 
@@ -9,6 +10,16 @@ import pandas as pd
 
 RAW_FIELD_NAMES = {"Close", "Adj Close", "Volume", "Open", "High", "Low"}
 CANONICAL_COLUMNS = ["date", "ticker", "close", "adj_close", "volume"]
+CANONICAL_PRICE_COLS = ["close", "adj_close", "volume"]
+
+RENAME_MAP = {
+    "Close": "close",
+    "Adj Close": "adj_close",
+    "AdjClose": "adj_close",
+    "Adj_Close": "adj_close",
+    "Volume": "volume",
+    "Close*": "close",
+}
 
 
 def empty_prices_frame() -> pd.DataFrame:
@@ -25,13 +36,29 @@ def normalize_yfinance_frame(raw: pd.DataFrame, tickers: Iterable[str]) -> pd.Da
     df = _ensure_tickers_first(raw)
 
     if isinstance(df.columns, pd.MultiIndex):
-        frames = [_normalize_single_ticker(df[ticker], str(ticker)) for ticker in df.columns.get_level_values(0).unique()]
-        normalized = pd.concat(frames, ignore_index=True)
+        normalized = _normalize_multi_ticker(df)
     else:
         inferred_ticker = tickers_list[0] if tickers_list else "TICKER"
         normalized = _normalize_single_ticker(df, inferred_ticker)
 
-    normalized["date"] = pd.to_datetime(normalized["date"])
+    return finalize_canonical_frame(normalized)
+
+
+def finalize_canonical_frame(normalized: pd.DataFrame) -> pd.DataFrame:
+    """Apply canonical dtypes and ordering to an assembled long frame."""
+    # yfinance already returns datetime64 indices; only parse when it didn't
+    if not pd.api.types.is_datetime64_any_dtype(normalized["date"]):
+        normalized["date"] = pd.to_datetime(normalized["date"])
+    # Categorical codes shrink the column to ints and speed up groupby/pivot downstream;
+    # interning the category labels makes later set/dict membership checks pointer-cheap
+    tickers_cat = normalized["ticker"].astype("category")
+    normalized["ticker"] = tickers_cat.cat.rename_categories(
+        [sys.intern(str(cat)) for cat in tickers_cat.cat.categories]
+    )
+
+    # float32 is plenty for display/returns and halves memory bandwidth downstream
+    normalized[["close", "adj_close"]] = normalized[["close", "adj_close"]].astype("float32")
+    normalized["volume"] = pd.to_numeric(normalized["volume"], errors="coerce", downcast="unsigned")
 
     return normalized.sort_values(["ticker", "date"]).reset_index(drop=True)
 
@@ -58,36 +85,40 @@ def _has_raw_field(level: Any) -> bool:
         return False
 
 
+def _normalize_multi_ticker(df: pd.DataFrame) -> pd.DataFrame:
+    """Reshape a (ticker, field) MultiIndex frame to long form in one stack."""
+    long = df.stack(level=0, future_stack=True)
+    long.index = long.index.set_names(["date", "ticker"])
+    long = long.reset_index()
+
+    long = long.rename(columns=lambda col: RENAME_MAP.get(col, col.lower() if isinstance(col, str) else col))
+    has_adj_close = "adj_close" in long.columns
+
+    long = long.reindex(columns=CANONICAL_COLUMNS)
+    if not has_adj_close:
+        long["adj_close"] = long["close"]
+
+    long["ticker"] = long["ticker"].astype(str).str.upper()
+
+    return long
+
+
 def _normalize_single_ticker(frame: pd.DataFrame, ticker: str) -> pd.DataFrame:
     if isinstance(frame, pd.Series):
         frame = frame.to_frame()
 
-    rename_map = {
-        "Close": "close",
-        "Adj Close": "adj_close",
-        "AdjClose": "adj_close",
-        "Adj_Close": "adj_close",
-        "Volume": "volume",
-        "Close*": "close",
-    }
-
-    working = frame.copy()
-    working.columns = [rename_map.get(col, col).lower() if isinstance(col, str) else col for col in working.columns]
+    working = frame.rename(columns=lambda col: RENAME_MAP.get(col, col.lower() if isinstance(col, str) else col))
+    has_adj_close = "adj_close" in working.columns
 
-    ordered_cols = [col for col in ("close", "adj_close", "volume") if col in working.columns]
-    working = working[ordered_cols]
+    # reindex both selects and adds any missing canonical columns (as NaN) in one shot
+    working = working.reindex(columns=CANONICAL_PRICE_COLS)
+    if not has_adj_close:
+        working["adj_close"] = working["close"]
 
     working = working.reset_index().rename(columns={"Date": "date", "Datetime": "date", "index": "date"})
     if "date" not in working.columns:
         working["date"] = working.index
 
-    for missing in ("close", "adj_close", "volume"):
-        if missing not in working.columns:
-            if missing == "adj_close" and "close" in working.columns:
-                working["adj_close"] = working["close"]
-            else:
-                working[missing] = pd.NA
-
-    working["ticker"] = ticker.upper()
+    working["ticker"] = sys.intern(ticker.upper())
 
     return working[CANONICAL_COLUMNS]
@@ -2,37 +2,67 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import os
+from datetime import datetime, time, timezone
 
 import pandas as pd
 import yfinance as yf
-import yfinance.data
 
-logger = logging.getLogger(__name__)
+try:
+    from curl_cffi import requests as curl_requests
+except ImportError:
+    curl_requests = None
 
-# Patch yfinance to bypass fc.yahoo.com check if requested via env var
-if os.getenv("YFINANCE_SKIP_COOKIE_CHECK", "0").lower() in ("1", "true", "yes"):
-    logger.warning("Patching yfinance to skip fc.yahoo.com cookie check (YFINANCE_SKIP_COOKIE_CHECK is set)")
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
-    def _get_cookie_basic_patched(self, timeout=30):
-        return True
+logger = logging.getLogger(__name__)
 
-    yfinance.data.YfData._get_cookie_basic = _get_cookie_basic_patched
+CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{ticker}"
+# Below this many tickers yf.download's thread pool is good enough
+ASYNC_TICKER_THRESHOLD = 8
+ASYNC_MAX_CONCURRENCY = 4
+ASYNC_INTERVALS = {"1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo"}
+# Bars at these intervals carry Yahoo's market-open epochs; yf.download
+# reports them as midnight dates, so the chart path must match
+DAILY_INTERVALS = {"1d", "5d", "1wk", "1mo"}
 
 from ..domain import PriceQuery
 from ..utils import DataRetrievalError
-from .normalization import empty_prices_frame, normalize_yfinance_frame
+from ..utils.yf_patch import ensure_patched
+from .normalization import empty_prices_frame, finalize_canonical_frame, normalize_yfinance_frame
 from .providers import PricesProvider
 
 
 class YFinancePricesProvider(PricesProvider):
     """Adapter around yfinance.download that emits canonical frames."""
 
+    def __init__(self) -> None:
+        ensure_patched()
+        # Reuse one keep-alive session across queries so repeated fetches skip
+        # TLS handshakes and cookie negotiation. yfinance only accepts
+        # curl_cffi sessions (a plain requests.Session is rejected by
+        # YfData._set_session); without curl_cffi, let yfinance build its own.
+        if curl_requests is not None:
+            self._session = curl_requests.Session(impersonate="chrome")
+        else:
+            self._session = None
+
     def fetch_prices(self, query: PriceQuery) -> pd.DataFrame:
         if not query.tickers:
             return empty_prices_frame()
 
+        if httpx is not None and len(query.tickers) > ASYNC_TICKER_THRESHOLD and query.interval in ASYNC_INTERVALS:
+            try:
+                frame = self._fetch_prices_async(query)
+                if not frame.empty:
+                    return frame
+            except Exception:
+                logger.warning("Concurrent chart fetch failed; falling back to yf.download", exc_info=True)
+
         try:
             raw = yf.download(
                 tickers=" ".join(query.tickers),
@@ -44,6 +74,7 @@ class YFinancePricesProvider(PricesProvider):
                 group_by="ticker",
                 progress=False,
                 threads=True,
+                session=self._session,
             )
         except Exception as err:  # pragma: no cover - defensive against network issues
             raise DataRetrievalError(f"yfinance download failed: {err}") from err
@@ -53,3 +84,78 @@ class YFinancePricesProvider(PricesProvider):
 
         return normalize_yfinance_frame(raw, query.tickers)
 
+    def _fetch_prices_async(self, query: PriceQuery) -> pd.DataFrame:
+        """Fetch Yahoo's chart endpoint for all tickers concurrently.
+
+        Bypasses yfinance's GIL-bound thread pool and DataFrame assembly:
+        JSON responses are parsed straight into the canonical long schema.
+        """
+        frames = asyncio.run(self._gather_charts(query))
+        if not frames:
+            return empty_prices_frame()
+        combined = pd.concat(frames, ignore_index=True)
+        return finalize_canonical_frame(combined)
+
+    async def _gather_charts(self, query: PriceQuery) -> list[pd.DataFrame]:
+        params = {
+            "period1": _to_epoch(query.start),
+            "period2": _to_epoch(query.end),
+            "interval": query.interval,
+            "includePrePost": str(query.include_extended).lower(),
+            "events": "div,splits",
+        }
+        headers = {"User-Agent": "Mozilla/5.0 (X11; Linux x86_64)"}
+        semaphore = asyncio.Semaphore(ASYNC_MAX_CONCURRENCY)
+
+        async with httpx.AsyncClient(headers=headers, timeout=30.0) as client:
+
+            async def fetch_one(ticker: str) -> pd.DataFrame | None:
+                async with semaphore:
+                    response = await client.get(CHART_URL.format(ticker=ticker), params=params)
+                response.raise_for_status()
+                return _chart_to_frame(ticker, response.json(), query.auto_adjust, query.interval)
+
+            results = await asyncio.gather(*(fetch_one(t) for t in query.tickers), return_exceptions=True)
+
+        frames: list[pd.DataFrame] = []
+        for ticker, result in zip(query.tickers, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Chart fetch failed for {ticker}: {result}")
+            elif result is not None and not result.empty:
+                frames.append(result)
+        return frames
+
+
+def _to_epoch(day) -> int:
+    return int(datetime.combine(day, time.min, tzinfo=timezone.utc).timestamp())
+
+
+def _chart_to_frame(ticker: str, payload: dict, auto_adjust: bool, interval: str) -> pd.DataFrame | None:
+    """Parse one v8 chart response into a canonical long frame."""
+    results = (payload.get("chart") or {}).get("result") or []
+    if not results:
+        return None
+    result = results[0]
+    timestamps = result.get("timestamp") or []
+    if not timestamps:
+        return None
+
+    quote = result["indicators"]["quote"][0]
+    close = quote.get("close")
+    adjclose_blocks = result["indicators"].get("adjclose") or [{}]
+    adj_close = adjclose_blocks[0].get("adjclose") or close
+
+    dates = pd.to_datetime(timestamps, unit="s")
+    if interval in DAILY_INTERVALS:
+        dates = dates.normalize()
+
+    return pd.DataFrame(
+        {
+            "date": dates,
+            "ticker": ticker.upper(),
+            "close": adj_close if auto_adjust else close,
+            "adj_close": adj_close,
+            "volume": quote.get("volume"),
+        }
+    )
+
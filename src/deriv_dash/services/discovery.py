@@ -2,19 +2,24 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 import streamlit as st
 import yfinance as yf
 
-from ..utils import yf_patch  # noqa: F401
+from ..utils.yf_patch import ensure_patched
 from ..data.yfinance_provider import YFinancePricesProvider
 from ..domain import PriceQuery
+from .prices_service import CACHE_DIR
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +40,27 @@ TICKER_UNIVERSE = [
     "XOM", "CVX", "SHEL", "BP", "TTE", "CAT", "DE", "GE", "HON", "BA", "UPS", "FDX",
 ]
 
-@dataclass
+class _Throttle:
+    """Thread-safe pacing gate: callers are spaced at least 1/max_rps apart."""
+
+    def __init__(self, max_rps: float) -> None:
+        self._min_interval = 1.0 / max_rps
+        self._lock = threading.Lock()
+        self._last = 0.0
+
+    def __call__(self) -> None:
+        with self._lock:
+            wait = self._min_interval - (time.monotonic() - self._last)
+            if wait > 0:
+                time.sleep(wait)
+            self._last = time.monotonic()
+
+
+# Shared by all download workers; paced below Yahoo's 429 threshold
+_YAHOO_THROTTLE = _Throttle(max_rps=5.0)
+
+
+@dataclass(slots=True)
 class TickerMetadata:
     ticker: str
     name: str
@@ -91,43 +116,45 @@ UNIVERSE_DATA = {
     "FDX": ("FedEx Corporation", "Industrials"),
 }
 
+# Name/sector as parallel arrays aligned with TICKER_UNIVERSE: position lookup
+# instead of a dict probe per symbol per refresh
+_NAMES = np.array([UNIVERSE_DATA.get(t, (t, "Unknown"))[0] for t in TICKER_UNIVERSE], dtype=object)
+_SECTORS = np.array([UNIVERSE_DATA.get(t, (t, "Unknown"))[1] for t in TICKER_UNIVERSE], dtype=object)
+
+# Constructed once — the universe is static and Ticker objects are reusable;
+# no network happens until fast_info is first touched
+_TICKERS = yf.Tickers(" ".join(TICKER_UNIVERSE))
+
+
 @st.cache_data(ttl=86400)  # Cache for 24 hours
 def get_ticker_universe_metadata() -> List[TickerMetadata]:
     """Fetch metadata for the curated ticker universe efficiently."""
-    metadata_list = []
-    
-    # Process in chunks to fetch fast_info (much faster than .info)
-    chunk_size = 20
-    for i in range(0, len(TICKER_UNIVERSE), chunk_size):
-        chunk = TICKER_UNIVERSE[i:i+chunk_size]
-        tickers_obj = yf.Tickers(" ".join(chunk))
-        
-        for symbol in chunk:
-            name, sector = UNIVERSE_DATA.get(symbol, (symbol, "Unknown"))
-            try:
-                # fast_info is significantly faster and doesn't require slow web scraping
-                mkt_cap = tickers_obj.tickers[symbol].fast_info.get("marketCap")
-                
-                metadata_list.append(TickerMetadata(
-                    ticker=symbol,
-                    name=name,
-                    market_cap=mkt_cap,
-                    sector=sector
-                ))
-            except Exception as e:
-                logger.warning(f"Failed to fetch fast_info for {symbol}: {e}")
-                metadata_list.append(TickerMetadata(
-                    ticker=symbol,
-                    name=name,
-                    market_cap=None,
-                    sector=sector
-                ))
-    
-    # Enrich with volatility
+    ensure_patched()
+
+    def _fetch_cap(symbol: str) -> Tuple[str, Optional[float]]:
+        try:
+            # fast_info is significantly faster and doesn't require slow web scraping
+            return symbol, _TICKERS.tickers[symbol].fast_info.get("marketCap")
+        except Exception as e:
+            logger.warning(f"Failed to fetch fast_info for {symbol}: {e}")
+            return symbol, None
+
+    # Each fast_info access is a blocking HTTP round-trip; overlap them
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        market_caps = dict(executor.map(_fetch_cap, TICKER_UNIVERSE))
+
     vol_map = get_universe_volatility(TICKER_UNIVERSE)
-    for meta in metadata_list:
-        meta.volatility_30d = vol_map.get(meta.ticker)
-        
+
+    metadata_list = []
+    for i, symbol in enumerate(TICKER_UNIVERSE):
+        metadata_list.append(TickerMetadata(
+            ticker=symbol,
+            name=_NAMES[i],
+            market_cap=market_caps.get(symbol),
+            sector=_SECTORS[i],
+            volatility_30d=vol_map.get(symbol)
+        ))
+
     return metadata_list
 
 @st.cache_data(ttl=86400)
@@ -135,14 +162,24 @@ def get_universe_volatility(tickers: List[str]) -> Dict[str, float]:
     """Calculate annualized 30-day volatility for a list of tickers in chunks."""
     end_date = date.today()
     start_date = end_date - timedelta(days=45)
-    
-    provider = YFinancePricesProvider()
-    all_vols = {}
-    
+
+    # The Streamlit cache is process-local; a Parquet snapshot per day keeps
+    # container restarts (and Yahoo outages) from re-fetching the universe
+    ticker_digest = hashlib.blake2b(repr(tuple(tickers)).encode(), digest_size=8).hexdigest()
+    cache_path = CACHE_DIR / f"vol_{end_date.isoformat()}_{ticker_digest}.parquet"
+    if cache_path.exists():
+        try:
+            return pd.read_parquet(cache_path)["vol"].to_dict()
+        except Exception:
+            logger.debug("Ignoring unreadable volatility cache %s", cache_path, exc_info=True)
+
     # Process in chunks to avoid yfinance throttling/failures on large batches
     chunk_size = 20
-    for i in range(0, len(tickers), chunk_size):
-        chunk = tickers[i : i + chunk_size]
+    chunks = [tickers[i : i + chunk_size] for i in range(0, len(tickers), chunk_size)]
+
+    def _vol_for_chunk(chunk: List[str]) -> Optional[Dict[str, float]]:
+        # One provider per worker so no HTTP session is shared across threads
+        provider = YFinancePricesProvider()
         query = PriceQuery(
             tickers=chunk,
             start=start_date,
@@ -150,45 +187,104 @@ def get_universe_volatility(tickers: List[str]) -> Dict[str, float]:
             interval="1d",
             auto_adjust=True
         )
-        
+
         try:
-            logger.info(f"Fetching volatility data for chunk {i//chunk_size + 1} ({len(chunk)} tickers)")
+            logger.info(f"Fetching volatility data for chunk starting at {chunk[0]} ({len(chunk)} tickers)")
+            _YAHOO_THROTTLE()
             df = provider.fetch_prices(query)
             if df.empty:
                 logger.warning(f"No price data found for chunk starting with {chunk[0]}")
-                continue
-                
+                return None
+
             wide = df.pivot(index="date", columns="ticker", values="close")
             if len(wide) < 2:
-                continue
-
-            returns = wide.pct_change().dropna(how="all")
-            recent_returns = returns.tail(30)
-            
-            if not recent_returns.empty:
-                vols = recent_returns.std() * np.sqrt(252)
-                all_vols.update(vols.dropna().to_dict())
-                
+                return {}
+
+            # Log-return volatility on the raw buffer: one NumPy pass instead
+            # of pct_change/std dispatching per column
+            arr = wide.to_numpy(dtype=np.float32)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                log_returns = np.diff(np.log(arr), axis=0)
+            tail = log_returns[-30:]
+            vols = np.nanstd(tail, axis=0, ddof=1) * np.sqrt(252)
+            return {ticker: float(vol) for ticker, vol in zip(wide.columns, vols) if np.isfinite(vol)}
+
         except Exception as e:
             logger.error(f"Failed to calculate volatility for chunk: {e}")
-            continue
-            
+            return None
+
+    all_vols: Dict[str, float] = {}
+    complete = True
+    # Network-bound work: a few threads overlap the chunk downloads without
+    # hammering Yahoo into 429s
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(_vol_for_chunk, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            result = future.result()
+            if result is None:
+                complete = False
+            else:
+                all_vols.update(result)
+
+    # Only a fully successful run is worth pinning for the day; a partial map
+    # written after transient 429s would otherwise be served until midnight
+    if complete and all_vols:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            pd.Series(all_vols, name="vol").to_frame().to_parquet(cache_path)
+        except Exception:
+            logger.debug("Could not write volatility cache %s", cache_path, exc_info=True)
+
     logger.info(f"Total tickers with volatility calculated: {len(all_vols)}")
     return all_vols
 
+# Static columns never change; build them once instead of per UI interaction
+_STATIC_DF = pd.DataFrame(
+    [(ticker, name, sector) for ticker, (name, sector) in UNIVERSE_DATA.items()],
+    columns=["Ticker", "Name", "Sector"],
+).set_index("Ticker")
+
+
+def _top_k(df: pd.DataFrame, column: str, k: int = 10) -> pd.DataFrame:
+    """Select the k largest rows by column with one scan, skipping NaNs."""
+    values = pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=np.float64)
+    keyed = np.where(np.isnan(values), -np.inf, values)
+    k = min(k, int((keyed > -np.inf).sum()))
+    if k == 0:
+        return df.iloc[0:0]
+    # argpartition is O(N) top-k; only the k winners get sorted
+    top = np.argpartition(-keyed, k - 1)[:k]
+    top = top[np.argsort(-keyed[top], kind="stable")]
+    return df.iloc[top]
+
+
 def get_discovery_insights(metadata: List[TickerMetadata]):
     """Prepare insights for the discovery UI."""
-    df = pd.DataFrame([
+    count = len(metadata)
+    # np.fromiter with a known count writes each column into one preallocated
+    # float64 buffer — no intermediate list and no per-row dtype inference
+    dynamic = pd.DataFrame(
         {
-            "Ticker": m.ticker,
-            "Name": m.name,
-            "Market Cap": m.market_cap,
-            "Sector": m.sector,
-            "Volatility (30d)": m.volatility_30d
-        } for m in metadata
-    ])
-    
-    top_mcap = df.dropna(subset=["Market Cap"]).sort_values("Market Cap", ascending=False).head(10)
-    top_vol = df.dropna(subset=["Volatility (30d)"]).sort_values("Volatility (30d)", ascending=False).head(10)
-    
+            "Market Cap": np.fromiter(
+                (np.nan if m.market_cap is None else m.market_cap for m in metadata),
+                dtype=np.float64,
+                count=count,
+            ),
+            "Volatility (30d)": np.fromiter(
+                (np.nan if m.volatility_30d is None else m.volatility_30d for m in metadata),
+                dtype=np.float64,
+                count=count,
+            ),
+        },
+        index=[m.ticker for m in metadata],
+    )
+    df = dynamic.join(_STATIC_DF)
+    # Tickers outside the curated universe keep the symbol-as-name fallback
+    df["Name"] = df["Name"].fillna(pd.Series(df.index, index=df.index))
+    df["Sector"] = df["Sector"].fillna("Unknown")
+    df = df.reset_index(names="Ticker")
+
+    top_mcap = _top_k(df, "Market Cap")
+    top_vol = _top_k(df, "Volatility (30d)")
+
     return top_mcap, top_vol
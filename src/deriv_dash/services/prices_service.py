@@ -2,24 +2,105 @@
 
 from __future__ import annotations
 
+import hashlib
+import logging
+import threading
+from concurrent.futures import Future
+from datetime import date
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
 
+from ..analytics._kernels import normalize_to_100
 from ..analytics.summary import build_summary
 from ..domain import PriceField, PriceQuery
 from ..utils import DataRetrievalError
 from ..data.providers import PricesProvider
 
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path.home() / ".cache" / "deriv_dash"
+
+# Concurrent sessions asking for the same query share one upstream fetch
+_INFLIGHT: dict[tuple, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _query_key(query: PriceQuery) -> tuple:
+    return (tuple(query.tickers), query.start, query.end, query.interval, query.auto_adjust, query.include_extended)
+
+
+def _query_cache_path(query: PriceQuery) -> Path:
+    digest = hashlib.blake2b(repr(_query_key(query)).encode(), digest_size=16).hexdigest()
+    return CACHE_DIR / f"prices_{digest}.parquet"
+
 
 def get_prices(provider: PricesProvider, query: PriceQuery) -> pd.DataFrame:
-    """Fetch canonical long-form prices."""
+    """Fetch canonical long-form prices, coalescing duplicate requests.
+
+    Identical queries issued while a fetch is in flight wait on the first
+    caller's Future instead of hitting yfinance again.
+    """
+    key = _query_key(query)
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _INFLIGHT[key] = future
+
+    if not is_owner:
+        return future.result()
+
     try:
-        return provider.fetch_prices(query)
+        prices = _load_prices(provider, query)
+    except BaseException as err:
+        future.set_exception(err)
+        raise
+    else:
+        future.set_result(prices)
+        return prices
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
+
+
+def _load_prices(provider: PricesProvider, query: PriceQuery) -> pd.DataFrame:
+    """Fetch canonical long-form prices, reusing an on-disk Parquet cache.
+
+    Unlike the Streamlit memory cache, the Parquet layer survives process
+    restarts, so a warm restart skips the network entirely.
+    """
+    # Ranges ending today are still accumulating bars (every timeframe button
+    # sets end=today), so freezing them on disk would pin intraday charts to
+    # their first fetch for the rest of the day; only closed ranges are cached
+    cacheable = query.end < date.today()
+    cache_path = _query_cache_path(query)
+    if cacheable and cache_path.exists():
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception:
+            logger.debug("Ignoring unreadable price cache %s", cache_path, exc_info=True)
+
+    try:
+        prices = provider.fetch_prices(query)
     except Exception as err:
         msg = f"Failed to fetch prices: {err}"
         if isinstance(err, DataRetrievalError):
             raise
         raise DataRetrievalError(msg) from err
 
+    if cacheable and not prices.empty:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            prices.to_parquet(cache_path, compression="zstd", index=False)
+        except Exception:
+            # Parquet support (pyarrow) is optional; the cache is best-effort
+            logger.debug("Could not write price cache %s", cache_path, exc_info=True)
+
+    return prices
+
 
 def get_price_matrix(prices_long: pd.DataFrame, field: PriceField) -> pd.DataFrame:
     """Pivot long-form prices to a wide matrix for charting."""
@@ -28,8 +109,15 @@ def get_price_matrix(prices_long: pd.DataFrame, field: PriceField) -> pd.DataFra
     usable = prices_long.dropna(subset=[field])
     if usable.empty:
         return pd.DataFrame()
-    matrix = usable.pivot(index="date", columns="ticker", values=field)
-    return matrix.sort_index()
+    if isinstance(usable["ticker"].dtype, pd.CategoricalDtype):
+        # Don't emit all-NaN columns for tickers dropped entirely by the dropna
+        usable = usable.assign(ticker=usable["ticker"].cat.remove_unused_categories())
+    # unstack on a unique (date, ticker) index skips pivot's duplicate checks
+    matrix = usable.set_index(["date", "ticker"])[field].unstack("ticker")
+    # Display/returns don't need float64; no-op when normalization already downcast
+    matrix = matrix.astype(np.float32, copy=False)
+    # Normalization sorts by date already, so this is usually a cheap O(n) check
+    return matrix if matrix.index.is_monotonic_increasing else matrix.sort_index()
 
 
 def get_normalized_matrix(prices_matrix: pd.DataFrame) -> pd.DataFrame:
@@ -37,16 +125,8 @@ def get_normalized_matrix(prices_matrix: pd.DataFrame) -> pd.DataFrame:
     if prices_matrix.empty:
         return pd.DataFrame()
 
-    def _normalize_series(series: pd.Series) -> pd.Series:
-        non_na = series.dropna()
-        if non_na.empty:
-            return series
-        base = non_na.iloc[0]
-        if base == 0:
-            return series
-        return (series / base) * 100
-
-    return prices_matrix.apply(_normalize_series)
+    values = normalize_to_100(prices_matrix.to_numpy(dtype=np.float64))
+    return pd.DataFrame(values, index=prices_matrix.index, columns=prices_matrix.columns)
 
 
 def build_summary_table(prices_long: pd.DataFrame, field: PriceField) -> pd.DataFrame:
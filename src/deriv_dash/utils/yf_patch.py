@@ -2,21 +2,32 @@
 
 import os
 import logging
-import yfinance.data
 
 logger = logging.getLogger(__name__)
 
-def patch_yfinance():
-    """Apply the cookie check bypass patch to yfinance."""
+_patched = False
+
+
+def ensure_patched() -> None:
+    """Apply the cookie check bypass patch on first real use of yfinance.
+
+    Deferred so importing this module doesn't drag in yfinance (an expensive
+    import) for code paths that never fetch data; callers invoke this right
+    before network work and the patch is applied at most once.
+    """
+    global _patched
+    if _patched:
+        return
+    _patched = True
+
+    import yfinance.data
+
     if os.getenv("YFINANCE_SKIP_COOKIE_CHECK", "1") == "1":
         logger.info("Applying yfinance cookie check bypass patch")
-        
+
         def _get_cookie_basic_patched(self, timeout=30):
             return True
 
         yfinance.data.YfData._get_cookie_basic = _get_cookie_basic_patched
     else:
         logger.info("yfinance patch skipped (YFINANCE_SKIP_COOKIE_CHECK != 1)")
-
-# Apply immediately on import
-patch_yfinance()
@@ -2,31 +2,46 @@
 
 from __future__ import annotations
 
+import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
 
+# Below this many rows SVG rendering stays snappy and looks crisper
+SCATTERGL_MIN_POINTS = 500
+
 
 def make_price_chart(prices_matrix: pd.DataFrame, title: str, log_y: bool = False, show_markers: bool = False) -> go.Figure:
     """Build a multi-ticker line chart from a price matrix."""
-    fig = go.Figure()
-
     if prices_matrix.empty:
+        fig = go.Figure()
         fig.add_annotation(text="No data to display", showarrow=False, x=0.5, y=0.5, xref="paper", yref="paper")
         fig.update_layout(title=title, template="plotly_white")
         return fig
 
-    mode = "lines+markers" if show_markers else "lines"
-    
-    for ticker in prices_matrix.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=prices_matrix.index,
-                y=prices_matrix[ticker],
+    if len(prices_matrix) >= SCATTERGL_MIN_POINTS:
+        # WebGL traces keep the browser responsive once the figure gets large.
+        # Plain dicts + skip_invalid bypass per-trace schema validation, a
+        # known Plotly hotspot for many-trace figures.
+        mode = "lines+markers" if show_markers else "lines"
+        x_values = prices_matrix.index
+        traces = [
+            dict(
+                type="scattergl",
+                x=x_values,
+                y=prices_matrix[ticker].to_numpy(),
                 mode=mode,
                 name=str(ticker),
-                marker=dict(size=4) if show_markers else None
+                marker=dict(size=4) if show_markers else None,
             )
-        )
+            for ticker in prices_matrix.columns
+        ]
+        fig = go.Figure(data=traces, skip_invalid=True)
+    else:
+        # px.line consumes the wide frame directly, building all SVG traces
+        # in one internal pass instead of per-column Python construction
+        fig = px.line(prices_matrix, markers=show_markers)
+        if show_markers:
+            fig.update_traces(marker=dict(size=4))
 
     fig.update_layout(
         title=title,
@@ -0,0 +1,44 @@
+"""Tests for main.py helpers."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pandas as pd
+
+from main import _frame_fingerprint, _to_csv_bytes, parse_tickers
+
+
+def test_parse_tickers_splits_commas_and_semicolons():
+    assert parse_tickers("aapl, msft; spy") == ("AAPL", "MSFT", "SPY")
+
+
+def test_parse_tickers_preserves_order_and_dedupes():
+    assert parse_tickers("SPY,aapl,spy,AAPL,msft") == ("SPY", "AAPL", "MSFT")
+
+
+def test_parse_tickers_drops_blanks_and_whitespace():
+    assert parse_tickers(" , ;  aapl  ,, ") == ("AAPL",)
+
+
+def test_parse_tickers_empty_input():
+    assert parse_tickers("") == ()
+
+
+def _matrix(scale: float = 1.0) -> pd.DataFrame:
+    idx = pd.date_range("2024-01-01", periods=3, name="date")
+    return pd.DataFrame({"AAPL": [10.0, 11.0, 12.0], "MSFT": [20.0, 21.0, 22.0]}, index=idx) * scale
+
+
+def test_frame_fingerprint_distinguishes_values():
+    # Same shape, columns and index span must not collide (close vs adj_close,
+    # raw vs normalized) or st.cache_data serves the stale frame
+    assert _frame_fingerprint(_matrix()) != _frame_fingerprint(_matrix(scale=0.98))
+    assert _frame_fingerprint(_matrix()) == _frame_fingerprint(_matrix())
+
+
+def test_to_csv_bytes_not_served_for_lookalike_frame():
+    first = _to_csv_bytes(_matrix(), index=True)
+    second = _to_csv_bytes(_matrix(scale=0.98), index=True)
+    assert first != second
@@ -0,0 +1,33 @@
+"""Tests for analytics return calculations."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import numpy as np
+import pandas as pd
+
+from deriv_dash.analytics.returns import compute_cumulative_returns, compute_daily_returns
+
+
+def test_daily_returns_basic():
+    prices = pd.DataFrame({"AAPL": [100.0, 110.0, 99.0]})
+    returns = compute_daily_returns(prices)
+    np.testing.assert_allclose(returns["AAPL"].to_numpy(), [0.1, -0.1])
+
+
+def test_cumulative_returns_skip_leading_nan():
+    # A ticker whose history starts after the window opens must not come
+    # back all-NaN: NaN returns compound as flat, like pandas cumprod
+    daily = pd.DataFrame({"LATE": [np.nan, 1.0, 0.5], "FULL": [0.1, 0.1, 0.1]})
+    cumulative = compute_cumulative_returns(daily)
+    np.testing.assert_allclose(cumulative["LATE"].to_numpy(), [np.nan, 1.0, 2.0])
+    np.testing.assert_allclose(cumulative["FULL"].to_numpy(), [0.1, 0.21, 0.331])
+
+
+def test_cumulative_returns_preserve_nan_positions():
+    daily = pd.DataFrame({"GAPPY": [0.5, np.nan, 0.5]})
+    cumulative = compute_cumulative_returns(daily)
+    assert np.isnan(cumulative["GAPPY"].iloc[1])
+    np.testing.assert_allclose(cumulative["GAPPY"].iloc[2], 1.25)